@@ -66,6 +66,8 @@ class ReachyBehaviors:
         self._emotion_task: Optional[asyncio.Task] = None
         self._tracking_task: Optional[asyncio.Task] = None
         self._running = False
+        # One pooled connection to the daemon for every move command
+        self._client = httpx.AsyncClient(base_url=daemon_url, timeout=5.0)
 
     async def start(self):
         """Start the behavior system"""
@@ -87,49 +89,46 @@ class ReachyBehaviors:
                     await task
                 except asyncio.CancelledError:
                     pass
+        await self._client.aclose()
         print("Behavior system stopped")
 
     async def _move_head(self, yaw: float, pitch: float, roll: float, duration: float = 0.3):
         """Move head to position"""
-        async with httpx.AsyncClient() as client:
-            try:
-                await client.post(
-                    f"{self.daemon_url}/api/move/goto",
-                    json={
-                        "head_pose": {
-                            "yaw": math.radians(yaw),
-                            "pitch": math.radians(pitch),
-                            "roll": math.radians(roll),
-                            "x": 0, "y": 0, "z": 0
-                        },
-                        "duration": duration,
-                        "interpolation_mode": "minjerk"
+        try:
+            await self._client.post(
+                "/api/move/goto",
+                json={
+                    "head_pose": {
+                        "yaw": math.radians(yaw),
+                        "pitch": math.radians(pitch),
+                        "roll": math.radians(roll),
+                        "x": 0, "y": 0, "z": 0
                     },
-                    timeout=5.0
-                )
-                self.state.yaw = yaw
-                self.state.pitch = pitch
-                self.state.roll = roll
-            except Exception as e:
-                pass  # Silent fail for smooth animation
+                    "duration": duration,
+                    "interpolation_mode": "minjerk"
+                }
+            )
+            self.state.yaw = yaw
+            self.state.pitch = pitch
+            self.state.roll = roll
+        except Exception as e:
+            pass  # Silent fail for smooth animation
 
     async def _move_antennas(self, left: float, right: float, duration: float = 0.2):
         """Move antennas"""
-        async with httpx.AsyncClient() as client:
-            try:
-                await client.post(
-                    f"{self.daemon_url}/api/move/goto",
-                    json={
-                        "antennas": [left, right],
-                        "duration": duration,
-                        "interpolation_mode": "minjerk"
-                    },
-                    timeout=5.0
-                )
-                self.state.antenna_left = left
-                self.state.antenna_right = right
-            except Exception:
-                pass
+        try:
+            await self._client.post(
+                "/api/move/goto",
+                json={
+                    "antennas": [left, right],
+                    "duration": duration,
+                    "interpolation_mode": "minjerk"
+                }
+            )
+            self.state.antenna_left = left
+            self.state.antenna_right = right
+        except Exception:
+            pass
 
     # ==================== BREATHING ====================
 
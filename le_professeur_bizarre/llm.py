@@ -5,8 +5,10 @@ Uses NVIDIA Nemotron via OpenRouter for translation and cultural facts
 
 import os
 import re
+import asyncio
 import httpx
 import json
+from contextlib import nullcontext
 from typing import Optional
 from dataclasses import dataclass
 
@@ -45,22 +47,83 @@ CRITICAL INSTRUCTIONS:
 Respond with ONLY this JSON (no other text):
 {"french_translation": "...", "cultural_fact": "...", "pronunciation_tip": "..."}"""
 
+# Placeholders translate() returns when it can't parse the model's reply
+TRANSLATION_ERROR = "Translation error"
+TRANSLATION_UNAVAILABLE = "Translation unavailable"
+INCOMPLETE_FACT = "Mon Dieu! The response was incomplete."
+CONFUSED_FACT = (
+    "Mon Dieu! My circuits got confused. But did you know that the French eat "
+    "approximately 26kg of cheese per person per year?"
+)
+
+BATCH_INSTRUCTIONS = """Translate EACH numbered phrase below, in order.
+Respond with ONLY this JSON (no other text), one result per phrase:
+{"results": [
+  {"french_translation": "...", "cultural_fact": "...", "pronunciation_tip": "..."}, ...
+]}
+
+"""
+
+# Structured output: providers that support it constrain generation to this shape,
+# the rest ignore it and the repair path in translate() still applies
+TRANSLATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "french_translation": {"type": "string"},
+        "cultural_fact": {"type": "string"},
+        "pronunciation_tip": {"type": "string"},
+    },
+    "required": ["french_translation", "cultural_fact", "pronunciation_tip"],
+    "additionalProperties": False,
+}
+
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "translation", "strict": True, "schema": TRANSLATION_SCHEMA},
+}
+
+BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "translations",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"results": {"type": "array", "items": TRANSLATION_SCHEMA}},
+            "required": ["results"],
+            "additionalProperties": False,
+        },
+    },
+}
+
 
 class NemotronTranslator:
     """Translator using NVIDIA Nemotron via OpenRouter"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        max_tokens: int = 800,
+        temperature: float = 0.7,
+    ):
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY environment variable is required")
 
         self.base_url = "https://openrouter.ai/api/v1"
         self.model = os.getenv("NEMOTRON_MODEL", "nvidia/nemotron-3-nano-30b-a3b")
+        # Optional caller-owned client for connection reuse; otherwise one per call,
+        # which keeps translate_sync safe across event loops
+        self.client = client
+        # Generous default leaves room for the reasoning model's <think> output;
+        # callers wanting short, repeatable replies can lower both
+        self.max_tokens = max_tokens
+        self.temperature = temperature
 
-    async def translate(self, english_text: str) -> TranslationResponse:
-        """Translate English to French with cultural commentary"""
-
-        async with httpx.AsyncClient() as client:
+    async def _post_chat(self, messages: list, max_tokens: int, response_format: dict) -> str:
+        """POST a chat completion to OpenRouter and return the reply text"""
+        async with (nullcontext(self.client) if self.client else httpx.AsyncClient()) as client:
             response = await client.post(
                 f"{self.base_url}/chat/completions",
                 headers={
@@ -71,85 +134,141 @@ class NemotronTranslator:
                 },
                 json={
                     "model": self.model,
-                    "messages": [
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": f"Translate to French: \"{english_text}\""}
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 800,
+                    "messages": messages,
+                    "temperature": self.temperature,
+                    "max_tokens": max_tokens,
+                    "response_format": response_format,
                 },
                 timeout=30.0
             )
 
             response.raise_for_status()
-            data = response.json()
+            return response.json()["choices"][0]["message"]["content"] or ""
+
+    async def translate(self, english_text: str) -> TranslationResponse:
+        """Translate English to French with cultural commentary"""
+
+        content = await self._post_chat(
+            [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": f"Translate to French: \"{english_text}\""}
+            ],
+            self.max_tokens,
+            RESPONSE_FORMAT,
+        )
+
+        # Parse JSON response. With structured output this is already bare JSON;
+        # the extraction and repair below cover models that ignore response_format
+        try:
+            # Strip out <think> tags from reasoning models
+            if "<think>" in content:
+                # Remove everything between <think> and </think>
+                content = re.sub(r'<think>.*?</think>', '', content, flags=re.DOTALL)
+
+            # Try to extract JSON from the response
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0]
+            elif "```" in content:
+                content = content.split("```")[1].split("```")[0]
 
-            content = data["choices"][0]["message"]["content"]
+            # Try to find JSON object in the content
+            json_match = re.search(r'\{[^{}]*"french_translation"[^{}]*\}', content, re.DOTALL)
+            if json_match:
+                content = json_match.group(0)
 
-            # Parse JSON response
+            # Try to parse JSON
             try:
-                # Strip out <think> tags from reasoning models
-                if "<think>" in content:
-                    # Remove everything between <think> and </think>
-                    content = re.sub(r'<think>.*?</think>', '', content, flags=re.DOTALL)
-
-                # Try to extract JSON from the response
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0]
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0]
-
-                # Try to find JSON object in the content
-                json_match = re.search(r'\{[^{}]*"french_translation"[^{}]*\}', content, re.DOTALL)
-                if json_match:
-                    content = json_match.group(0)
-
-                # Try to parse JSON
+                parsed = json.loads(content.strip())
+            except json.JSONDecodeError:
+                # Try to fix common issues
+                # Remove French quotation marks that might cause issues
+                content = content.replace('«', '"').replace('»', '"')
+                # Try to complete truncated JSON
+                if content.count('"') % 2 == 1:
+                    content = content + '"}'
+                if not content.strip().endswith('}'):
+                    content = content + '}'
                 try:
                     parsed = json.loads(content.strip())
-                except json.JSONDecodeError:
-                    # Try to fix common issues
-                    # Remove French quotation marks that might cause issues
-                    content = content.replace('«', '"').replace('»', '"')
-                    # Try to complete truncated JSON
-                    if content.count('"') % 2 == 1:
-                        content = content + '"}'
-                    if not content.strip().endswith('}'):
-                        content = content + '}'
-                    try:
-                        parsed = json.loads(content.strip())
-                    except:
-                        # Extract what we can manually
-                        french_match = re.search(r'"french_translation"\s*:\s*"([^"]*)', content)
-                        fact_match = re.search(r'"cultural_fact"\s*:\s*"([^"]*)', content)
-                        tip_match = re.search(r'"pronunciation_tip"\s*:\s*"([^"]*)', content)
-
-                        return TranslationResponse(
-                            original=english_text,
-                            french_translation=french_match.group(1) if french_match else "Translation error",
-                            cultural_fact=fact_match.group(1) if fact_match else "Mon Dieu! The response was incomplete.",
-                            pronunciation_tip=tip_match.group(1) if tip_match else None
-                        )
-
-                return TranslationResponse(
-                    original=english_text,
-                    french_translation=parsed.get("french_translation", ""),
-                    cultural_fact=parsed.get("cultural_fact", ""),
-                    pronunciation_tip=parsed.get("pronunciation_tip")
-                )
-            except json.JSONDecodeError:
-                # Fallback: try to extract meaning from raw text
-                return TranslationResponse(
-                    original=english_text,
-                    french_translation=content[:200] if content else "Translation unavailable",
-                    cultural_fact="Mon Dieu! My circuits got confused. But did you know that the French eat approximately 26kg of cheese per person per year?",
-                    pronunciation_tip=None
-                )
+                except:
+                    # Extract what we can manually
+                    french_match = re.search(r'"french_translation"\s*:\s*"([^"]*)', content)
+                    fact_match = re.search(r'"cultural_fact"\s*:\s*"([^"]*)', content)
+                    tip_match = re.search(r'"pronunciation_tip"\s*:\s*"([^"]*)', content)
+
+                    return TranslationResponse(
+                        original=english_text,
+                        french_translation=french_match.group(1) if french_match else TRANSLATION_ERROR,
+                        cultural_fact=fact_match.group(1) if fact_match else INCOMPLETE_FACT,
+                        pronunciation_tip=tip_match.group(1) if tip_match else None
+                    )
+
+            return TranslationResponse(
+                original=english_text,
+                french_translation=parsed.get("french_translation", ""),
+                cultural_fact=parsed.get("cultural_fact", ""),
+                pronunciation_tip=parsed.get("pronunciation_tip")
+            )
+        except json.JSONDecodeError:
+            # Fallback: try to extract meaning from raw text
+            return TranslationResponse(
+                original=english_text,
+                french_translation=content[:200] if content else TRANSLATION_UNAVAILABLE,
+                cultural_fact=CONFUSED_FACT,
+                pronunciation_tip=None
+            )
+
+    async def translate_many(
+        self, phrases: list[str], concurrency: int = 5
+    ) -> list[TranslationResponse]:
+        """Translate several phrases with a single request
+
+        Falls back to translate() per phrase, at most `concurrency` at a time,
+        if the batched reply can't be parsed or doesn't have one result per phrase.
+        """
+        if not phrases:
+            return []
+
+        numbered = "\n".join(f"{i}. \"{phrase}\"" for i, phrase in enumerate(phrases, 1))
+        content = await self._post_chat(
+            [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": BATCH_INSTRUCTIONS + numbered}
+            ],
+            self.max_tokens * len(phrases),
+            BATCH_RESPONSE_FORMAT,
+        )
+
+        # Strip reasoning and code fences, then take the outermost object
+        content = re.sub(r'<think>.*?</think>', '', content, flags=re.DOTALL)
+        start, end = content.find("{"), content.rfind("}")
+        try:
+            results = json.loads(content[start:end + 1])["results"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            results = None
+
+        if (not isinstance(results, list) or len(results) != len(phrases)
+                or not all(isinstance(result, dict) for result in results)):
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def translate_one(phrase):
+                async with semaphore:
+                    return await self.translate(phrase)
+
+            return list(await asyncio.gather(*(translate_one(phrase) for phrase in phrases)))
+
+        return [
+            TranslationResponse(
+                original=phrase,
+                french_translation=result.get("french_translation", ""),
+                cultural_fact=result.get("cultural_fact", ""),
+                pronunciation_tip=result.get("pronunciation_tip")
+            )
+            for phrase, result in zip(phrases, results)
+        ]
 
     def translate_sync(self, english_text: str) -> TranslationResponse:
         """Synchronous version of translate for non-async contexts"""
-        import asyncio
-
         try:
             loop = asyncio.get_event_loop()
         except RuntimeError:
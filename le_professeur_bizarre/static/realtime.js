@@ -0,0 +1,618 @@
+// ==================== STATE ====================
+let ws = null;
+let stateWs = null;
+let audioContext = null;
+let mediaStream = null;
+let isListening = false;
+let isAISpeaking = false;
+
+const robotViewport = document.getElementById('robotViewport');
+const robotHead = document.getElementById('robotHead');
+const daemonDot = document.getElementById('daemonDot');
+const daemonStatus = document.getElementById('daemonStatus');
+const aiDot = document.getElementById('aiDot');
+const aiStatus = document.getElementById('aiStatus');
+const transcript = document.getElementById('transcript');
+const scrollAnchor = document.getElementById('scrollAnchor');
+const messageTemplate = document.getElementById('messageTemplate');
+const talkBtn = document.getElementById('talkBtn');
+const talkText = document.getElementById('talkText');
+
+// Reconnect delay: 2s doubling up to 30s, with jitter so tabs don't retry in sync
+function reconnectDelay(attempt) {
+    return Math.min(30000, 2000 * 2 ** attempt) + Math.random() * 500;
+}
+
+// ==================== ROBOT VISUALIZATION ====================
+let stateRetries = 0;
+const ANGLE_EPSILON = 0.5;  // degrees
+let pendingState = null;
+let rafScheduled = false;
+let lastApplied = null;
+
+function connectStateWebSocket() {
+    const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+    stateWs = new WebSocket(`${protocol}//${window.location.host}/ws/reachy-state`);
+
+    stateWs.onopen = () => {
+        stateRetries = 0;
+        robotViewport.classList.add('live');
+        daemonDot.classList.add('connected');
+        daemonStatus.textContent = 'Live';
+    };
+
+    stateWs.onmessage = (event) => {
+        const state = JSON.parse(event.data);
+        if (state.error) {
+            robotViewport.classList.remove('live');
+            daemonDot.classList.remove('connected');
+            daemonStatus.textContent = 'Offline';
+            return;
+        }
+        // Keep only the latest state and apply it once per display frame
+        robotViewport.classList.add('live');
+        pendingState = state;
+        if (!rafScheduled) {
+            rafScheduled = true;
+            requestAnimationFrame(applyPendingState);
+        }
+    };
+
+    stateWs.onclose = () => {
+        robotViewport.classList.remove('live');
+        daemonDot.classList.remove('connected');
+        daemonStatus.textContent = 'Disconnected';
+        setTimeout(connectStateWebSocket, reconnectDelay(stateRetries++));
+    };
+}
+
+function applyPendingState() {
+    rafScheduled = false;
+    updateRobotVisualization(pendingState);
+}
+
+function updateRobotVisualization(state) {
+    const { yaw, pitch, roll, antenna_left, antenna_right, speaking } = state;
+
+    robotHead.classList.toggle('speaking', Boolean(speaking));
+
+    // Skip transform writes when nothing moved noticeably
+    if (lastApplied &&
+        Math.abs(yaw - lastApplied.yaw) < ANGLE_EPSILON &&
+        Math.abs(pitch - lastApplied.pitch) < ANGLE_EPSILON &&
+        Math.abs(roll - lastApplied.roll) < ANGLE_EPSILON &&
+        Math.abs(antenna_left - lastApplied.antenna_left) * 45 < ANGLE_EPSILON &&
+        Math.abs(antenna_right - lastApplied.antenna_right) * 45 < ANGLE_EPSILON) {
+        return;
+    }
+    lastApplied = { yaw, pitch, roll, antenna_left, antenna_right };
+
+    // The transforms live in CSS; only the inherited pose variables change
+    const headStyle = robotHead.style;
+    headStyle.setProperty('--yaw', yaw);
+    headStyle.setProperty('--pitch', pitch);
+    headStyle.setProperty('--roll', roll);
+    headStyle.setProperty('--antenna-left', antenna_left);
+    headStyle.setProperty('--antenna-right', antenna_right);
+}
+
+// ==================== AUDIO ====================
+// Microphone capture runs on the audio rendering thread: the processor
+// converts float samples to PCM16 and transfers full chunks to us.
+// PCM16 is sent as-is because the Realtime API only accepts pcm16 or
+// G.711 input; compressed MediaRecorder/Opus chunks would need decoding
+// on the server before they could be forwarded.
+const CAPTURE_WORKLET = `
+    class PcmCaptureProcessor extends AudioWorkletProcessor {
+        constructor(options) {
+            super();
+            this.chunkSamples = options.processorOptions.chunkSamples;
+            this.chunk = new Int16Array(this.chunkSamples);
+            this.offset = 0;
+            // Chunks come back from the page once sent, so capture
+            // settles into reusing a few buffers instead of allocating
+            this.free = [];
+            this.port.onmessage = (e) => this.free.push(new Int16Array(e.data));
+        }
+
+        process(inputs) {
+            const input = inputs[0][0];
+            if (!input) return true;
+            for (let i = 0; i < input.length; i++) {
+                // Saturate before the store: Int16Array wraps out-of-range values
+                const s = input[i] * 32768;
+                this.chunk[this.offset++] = s < -32768 ? -32768 : s > 32767 ? 32767 : s | 0;
+                if (this.offset === this.chunk.length) {
+                    this.port.postMessage(this.chunk.buffer, [this.chunk.buffer]);
+                    this.chunk = this.free.pop() || new Int16Array(this.chunkSamples);
+                    this.offset = 0;
+                }
+            }
+            return true;
+        }
+    }
+    registerProcessor('pcm-capture', PcmCaptureProcessor);
+`;
+
+const CAPTURE_CHUNK_SAMPLES = 1024;  // ~42 ms at 24 kHz
+
+let micSource = null;
+let captureNode = null;
+
+async function initAudio() {
+    try {
+        audioContext = new (window.AudioContext || window.webkitAudioContext)({
+            sampleRate: 24000
+        });
+
+        const workletUrl = URL.createObjectURL(
+            new Blob([CAPTURE_WORKLET], { type: 'application/javascript' })
+        );
+        await audioContext.audioWorklet.addModule(workletUrl);
+        URL.revokeObjectURL(workletUrl);
+
+        mediaStream = await navigator.mediaDevices.getUserMedia({
+            audio: {
+                sampleRate: 24000,
+                channelCount: 1,
+                echoCancellation: true,
+                noiseSuppression: true
+            }
+        });
+
+        return true;
+    } catch (e) {
+        console.error('Audio init error:', e);
+        alert('Could not access microphone: ' + e.message);
+        return false;
+    }
+}
+
+function startRecording() {
+    if (!mediaStream) return;
+
+    micSource = audioContext.createMediaStreamSource(mediaStream);
+    captureNode = new AudioWorkletNode(audioContext, 'pcm-capture', {
+        processorOptions: { chunkSamples: CAPTURE_CHUNK_SAMPLES }
+    });
+
+    const port = captureNode.port;
+    port.onmessage = (e) => {
+        if (isListening && ws && ws.readyState === WebSocket.OPEN && !isAISpeaking) {
+            // Binary frames carry raw PCM16; JSON text frames are control messages.
+            // send() copies the bytes, so the chunk can be reused right away.
+            ws.send(e.data);
+        }
+        port.postMessage(e.data, [e.data]);
+    };
+
+    micSource.connect(captureNode);
+    captureNode.connect(audioContext.destination);
+}
+
+function stopRecording() {
+    if (captureNode) {
+        captureNode.port.onmessage = null;
+        captureNode.disconnect();
+        micSource.disconnect();
+        captureNode = null;
+        micSource = null;
+    }
+}
+
+const PCM16_SCALE = 1 / 32768;
+
+// Ended AudioBuffers are reused for later chunks of the same length
+const AUDIO_BUFFER_POOL_SIZE = 8;
+const audioBufferPool = [];
+
+function getAudioBuffer(length) {
+    const i = audioBufferPool.findIndex(b => b.length === length);
+    if (i !== -1) return audioBufferPool.splice(i, 1)[0];
+    return audioContext.createBuffer(1, length, 24000);
+}
+
+function releaseAudioBuffer(audioBuffer) {
+    if (audioBufferPool.length < AUDIO_BUFFER_POOL_SIZE) audioBufferPool.push(audioBuffer);
+}
+
+// Queue for sequential audio playback. OpenAI streams faster than real
+// time, so the cap is generous; it only guards against a stalled context.
+const MAX_QUEUED_SAMPLES = 24000 * 30;  // 30 s at 24 kHz
+let playbackQueue = [];
+let queuedSamples = 0;
+let currentlyPlaying = false;
+
+async function playAudio(pcm16) {
+    if (!audioContext) return;
+    playbackQueue.push(pcm16);
+    queuedSamples += pcm16.length;
+    // Drop the oldest audio once the backlog exceeds the cap
+    while (queuedSamples > MAX_QUEUED_SAMPLES && playbackQueue.length > 1) {
+        queuedSamples -= playbackQueue.shift().length;
+    }
+    if (!currentlyPlaying) drainPlaybackQueue();
+}
+
+// The only consumer of playbackQueue: plays chunks strictly one after another
+async function drainPlaybackQueue() {
+    currentlyPlaying = true;
+    isAISpeaking = true;
+    while (playbackQueue.length > 0) {
+        const pcm16 = playbackQueue.shift();
+        queuedSamples -= pcm16.length;
+        await playChunk(pcm16);
+    }
+    currentlyPlaying = false;
+    isAISpeaking = false;
+}
+
+function playChunk(pcm16) {
+    return new Promise((resolve) => {
+        // Convert straight into the buffer's channel data: one pass, no temp array
+        const audioBuffer = getAudioBuffer(pcm16.length);
+        const channel = audioBuffer.getChannelData(0);
+        for (let i = 0; i < pcm16.length; i++) {
+            channel[i] = pcm16[i] * PCM16_SCALE;
+        }
+
+        const source = audioContext.createBufferSource();
+        source.buffer = audioBuffer;
+        source.connect(audioContext.destination);
+        source.onended = () => {
+            releaseAudioBuffer(audioBuffer);
+            resolve();
+        };
+        source.start();
+    });
+}
+
+// ==================== WEBSOCKET ====================
+let realtimeRetries = 0;
+const MAX_REALTIME_RETRIES = 8;
+
+function connectRealtimeWebSocket() {
+    const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+    ws = new WebSocket(`${protocol}//${window.location.host}/ws/realtime`);
+    ws.binaryType = 'arraybuffer';
+    // The server accepts before checking the key or reaching OpenAI, so only
+    // its 'connected' message means the session actually came up
+    let sessionReady = false;
+    let setupFailed = false;
+
+    ws.onopen = () => {
+        aiDot.classList.add('connected');
+        aiStatus.textContent = 'Connected';
+        talkBtn.disabled = false;
+    };
+
+    ws.onmessage = async (event) => {
+        if (event.data instanceof ArrayBuffer) {
+            // Binary frames are PCM16 audio from the AI
+            await playAudio(new Int16Array(event.data));
+            return;
+        }
+
+        const data = JSON.parse(event.data);
+
+        if (data.type === 'connected') {
+            sessionReady = true;
+            realtimeRetries = 0;
+            addMessage('assistant', data.message);
+        }
+        else if (data.type === 'audio_start') {
+            playbackQueue = [];
+            queuedSamples = 0;
+            isAISpeaking = true;
+        }
+        else if (data.type === 'transcript') {
+            if (data.role === 'user' && data.text) {
+                addMessage('user', data.text);
+            } else if (data.role === 'assistant' && data.delta) {
+                appendToLastMessage(data.delta);
+            }
+        }
+        else if (data.type === 'tool_call') {
+            addToolCall(data.name, data.result);
+        }
+        else if (data.type === 'error') {
+            // An error before 'connected' (missing key, OpenAI down) won't fix itself on retry
+            if (!sessionReady) setupFailed = true;
+            addMessage('assistant', 'Error: ' + data.message);
+        }
+        else if (data.type === 'audio_done') {
+            setTimeout(() => {
+                if (playbackQueue.length === 0) isAISpeaking = false;
+            }, 300);
+        }
+    };
+
+    ws.onclose = () => {
+        aiDot.classList.remove('connected');
+        aiStatus.textContent = 'Disconnected';
+        talkBtn.disabled = true;
+        if (isListening) stopTalking();
+        if (setupFailed || realtimeRetries >= MAX_REALTIME_RETRIES) {
+            aiStatus.textContent = 'Disconnected - reload to retry';
+            return;
+        }
+        setTimeout(connectRealtimeWebSocket, reconnectDelay(realtimeRetries++));
+    };
+
+    ws.onerror = (e) => console.error('WebSocket error:', e);
+}
+
+// ==================== UI ====================
+let lastAssistantMessage = null;
+let lastAssistantText = null;
+let pendingDelta = '';
+let deltaScheduled = false;
+
+// Scroll to the bottom sentinel once per frame, without reading scrollHeight
+let scrollScheduled = false;
+
+function scrollToBottom() {
+    if (scrollScheduled) return;
+    scrollScheduled = true;
+    requestAnimationFrame(() => {
+        scrollScheduled = false;
+        scrollAnchor.scrollIntoView({ block: 'end' });
+    });
+}
+
+function flushPendingDelta() {
+    if (pendingDelta && lastAssistantText) {
+        lastAssistantText.appendData(pendingDelta);
+        scrollToBottom();
+    }
+    pendingDelta = '';
+}
+
+function endAssistantMessage() {
+    flushPendingDelta();
+    lastAssistantMessage = null;
+    lastAssistantText = null;
+}
+
+function addMessage(role, text) {
+    flushPendingDelta();
+
+    const isUser = role === 'user';
+    const wrapper = messageTemplate.content.firstElementChild.cloneNode(true);
+    wrapper.className = isUser ? 'wrap-user' : 'wrap-bot';
+    wrapper.firstElementChild.textContent = isUser ? 'You' : 'Le Professeur';
+
+    const msg = wrapper.lastElementChild;
+    msg.classList.add(isUser ? 'message-user' : 'message-robot');
+    const textNode = document.createTextNode(text);
+    msg.appendChild(textNode);
+
+    transcript.insertBefore(wrapper, scrollAnchor);
+    scrollToBottom();
+
+    if (role === 'assistant') {
+        lastAssistantMessage = msg;
+        lastAssistantText = textNode;
+    }
+}
+
+function appendToLastMessage(delta) {
+    if (!lastAssistantMessage) {
+        addMessage('assistant', delta);
+        return;
+    }
+    // Append once per frame to the bubble's text node
+    pendingDelta += delta;
+    if (!deltaScheduled) {
+        deltaScheduled = true;
+        requestAnimationFrame(() => {
+            deltaScheduled = false;
+            flushPendingDelta();
+        });
+    }
+}
+
+function addToolCall(name, result) {
+    const div = document.createElement('div');
+    div.className = 'tool-call';
+    div.textContent = `${name}: ${result}`;
+    endAssistantMessage();
+    transcript.insertBefore(div, scrollAnchor);
+    scrollToBottom();
+}
+
+function toggleTalking() {
+    if (isListening) {
+        stopTalking();
+    } else {
+        startTalking();
+    }
+}
+
+function startTalking() {
+    if (audioContext && audioContext.state === 'suspended') {
+        audioContext.resume();
+    }
+
+    isListening = true;
+    talkBtn.classList.add('listening');
+    talkText.textContent = 'Listening...';
+    startRecording();
+    endAssistantMessage();
+}
+
+function stopTalking() {
+    isListening = false;
+    talkBtn.classList.remove('listening');
+    talkText.textContent = 'Click to Talk';
+    stopRecording();
+}
+
+async function startConversation() {
+    const overlay = document.getElementById('connectionOverlay');
+    if (await initAudio()) {
+        overlay.classList.add('hidden');
+        connectRealtimeWebSocket();
+    }
+}
+
+async function triggerBehavior(action) {
+    try {
+        await fetch(`/api/behavior/${action}`, { method: 'POST', keepalive: true });
+    } catch (e) {
+        console.error('Behavior error:', e);
+    }
+}
+
+// Start state streaming immediately
+connectStateWebSocket();
+
+// ==================== WEBCAM / VISION ====================
+// Half resolution is enough for object recognition; very slow links go lower
+const SLOW_LINK = ['slow-2g', '2g'].includes(navigator.connection && navigator.connection.effectiveType);
+const FRAME_WIDTH = SLOW_LINK ? 160 : 320;
+const FRAME_HEIGHT = SLOW_LINK ? 120 : 240;
+const FRAME_QUALITY = 0.6;
+const FRAME_INTERVAL_MS = 2000;
+
+// Where supported (Chromium), frames are pulled, scaled and JPEG-encoded
+// in a worker so the vision pipeline never touches the UI thread.
+const FRAME_WORKER = `
+    self.onmessage = (e) => {
+        const { readable, url, width, height, quality, interval } = e.data;
+        const reader = readable.getReader();
+        const canvas = new OffscreenCanvas(width, height);
+        const ctx = canvas.getContext('2d');
+        let busy = false;
+
+        const timer = setInterval(async () => {
+            if (busy) return;
+            busy = true;
+            try {
+                const { value: frame, done } = await reader.read();
+                if (done) {
+                    clearInterval(timer);
+                    return;
+                }
+                ctx.drawImage(frame, 0, 0, width, height);
+                frame.close();
+                const blob = await canvas.convertToBlob({ type: 'image/jpeg', quality });
+                await fetch(url, {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'image/jpeg' },
+                    body: blob
+                });
+            } catch (err) {
+                console.log('Frame send error:', err);
+            } finally {
+                busy = false;
+            }
+        }, interval);
+    };
+`;
+
+let cameraStream = null;
+let cameraEnabled = false;
+let frameInterval = null;
+let frameWorker = null;
+
+const webcam = document.getElementById('webcam');
+const webcamCanvas = document.getElementById('webcamCanvas');
+const webcamOverlay = document.getElementById('webcamOverlay');
+const camToggle = document.getElementById('camToggle');
+const crosshair = document.getElementById('crosshair');
+
+async function toggleCamera() {
+    if (cameraEnabled) {
+        stopCamera();
+    } else {
+        await startCamera();
+    }
+}
+
+async function startCamera() {
+    try {
+        cameraStream = await navigator.mediaDevices.getUserMedia({
+            video: { facingMode: 'environment', width: 640, height: 480 }
+        });
+        webcam.srcObject = cameraStream;
+        // Size once: assigning width/height reallocates the canvas and resets its context
+        webcamCanvas.width = FRAME_WIDTH;
+        webcamCanvas.height = FRAME_HEIGHT;
+        webcamOverlay.classList.add('hidden');
+        crosshair.style.display = 'block';
+        camToggle.textContent = 'Camera On';
+        camToggle.classList.add('active');
+        cameraEnabled = true;
+        startFrameCapture();
+    } catch (e) {
+        console.error('Camera error:', e);
+        alert('Could not access camera: ' + e.message);
+    }
+}
+
+function stopCamera() {
+    if (cameraStream) {
+        cameraStream.getTracks().forEach(track => track.stop());
+        cameraStream = null;
+    }
+    webcam.srcObject = null;
+    webcamOverlay.classList.remove('hidden');
+    crosshair.style.display = 'none';
+    camToggle.textContent = 'Enable Camera';
+    camToggle.classList.remove('active');
+    cameraEnabled = false;
+
+    if (frameInterval) {
+        clearInterval(frameInterval);
+        frameInterval = null;
+    }
+    if (frameWorker) {
+        frameWorker.terminate();
+        frameWorker = null;
+    }
+}
+
+function startFrameCapture() {
+    if (window.MediaStreamTrackProcessor && window.OffscreenCanvas) {
+        const track = cameraStream.getVideoTracks()[0];
+        const processor = new MediaStreamTrackProcessor({ track, maxBufferSize: 1 });
+        const workerUrl = URL.createObjectURL(
+            new Blob([FRAME_WORKER], { type: 'application/javascript' })
+        );
+        frameWorker = new Worker(workerUrl);
+        URL.revokeObjectURL(workerUrl);
+        frameWorker.postMessage({
+            readable: processor.readable,
+            // Blob workers cannot resolve relative URLs
+            url: new URL('/api/camera/frame', window.location.href).href,
+            width: FRAME_WIDTH,
+            height: FRAME_HEIGHT,
+            quality: FRAME_QUALITY,
+            interval: FRAME_INTERVAL_MS
+        }, [processor.readable]);
+        return;
+    }
+
+    frameInterval = setInterval(() => {
+        if (!cameraEnabled) return;
+        captureAndSendFrame();
+    }, FRAME_INTERVAL_MS);
+}
+
+function captureAndSendFrame() {
+    if (!webcam.videoWidth) return;
+
+    const ctx = webcamCanvas.getContext('2d');
+    ctx.drawImage(webcam, 0, 0, FRAME_WIDTH, FRAME_HEIGHT);
+
+    // Async JPEG encode, posted as a raw body (no base64/JSON wrapping)
+    webcamCanvas.toBlob((blob) => {
+        if (!blob) return;
+        fetch('/api/camera/frame', {
+            method: 'POST',
+            headers: { 'Content-Type': 'image/jpeg' },
+            body: blob
+        }).catch(e => console.log('Frame send error:', e));
+    }, 'image/jpeg', FRAME_QUALITY);
+}
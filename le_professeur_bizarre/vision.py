@@ -4,11 +4,22 @@ Uses NVIDIA Nemotron VL for image understanding
 """
 
 import os
+import re
+import asyncio
 import base64
+import hashlib
+from collections import OrderedDict
+from io import BytesIO
 import httpx
+import orjson
 from typing import Optional
 from dataclasses import dataclass
 
+try:
+    from PIL import Image
+except ImportError:  # Optional: pip install le_professeur_bizarre[speedups]
+    Image = None
+
 
 @dataclass
 class VisionResponse:
@@ -27,6 +38,62 @@ OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 # System prompt for vision analysis - kept very simple for Nemotron VL
 VISION_SYSTEM_PROMPT = """You identify objects in images. Name the main object you see in 1-3 words. Be specific and accurate. If unclear, say 'unclear'."""
 
+# Object phrases in the model's reasoning, like "it's a", "this is a", "I see a".
+# Tried in priority order: the first pattern that matches anywhere wins.
+_OBJ_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"it's\s+(?:a\s+)?([a-zA-Z\s]+?)(?:\.|,|$)",
+        r"this\s+is\s+(?:a\s+)?([a-zA-Z\s]+?)(?:\.|,|$)",
+        r"I\s+see\s+(?:a\s+)?([a-zA-Z\s]+?)(?:\.|,|$)",
+        r"shows?\s+(?:a\s+)?([a-zA-Z\s]+?)(?:\.|,|$)",
+    )
+]
+
+_HEADERS = {
+    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+    "Content-Type": "application/json",
+    "HTTP-Referer": "https://huggingface.co/spaces/Franciscomoney/le_professeur_bizarre",
+    "X-Title": "Le Professeur Bizarre Vision"
+}
+
+# Shared client so repeat lookups reuse the TLS connection to OpenRouter
+_client = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60)
+)
+
+# Larger uploads are shrunk before being sent to the model (needs Pillow)
+DOWNSCALE_MIN_BYTES = 200_000
+DOWNSCALE_MAX_EDGE = 768
+
+
+def _downscale(image_data_url: str) -> str:
+    """Resize a data-URL image to DOWNSCALE_MAX_EDGE and re-encode it as JPEG"""
+    raw = base64.b64decode(image_data_url.split(",", 1)[-1])
+    img = Image.open(BytesIO(raw))
+    img.thumbnail((DOWNSCALE_MAX_EDGE, DOWNSCALE_MAX_EDGE), Image.LANCZOS)
+    buf = BytesIO()
+    img.convert("RGB").save(buf, "JPEG", quality=85, optimize=True)
+    return "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+# Identified objects for recently analyzed images, keyed on a hash of prompt + image
+VISION_CACHE_SIZE = 256
+_vision_cache: "OrderedDict[bytes, VisionResponse]" = OrderedDict()
+
+
+def _cache_result(key: bytes, result: VisionResponse) -> VisionResponse:
+    _vision_cache[key] = result
+    if len(_vision_cache) > VISION_CACHE_SIZE:
+        _vision_cache.popitem(last=False)
+    return result
+
+
+async def close_client():
+    """Close the shared OpenRouter client"""
+    await _client.aclose()
+
 
 async def analyze_image(image_base64: str, prompt: str = "What do you see?") -> VisionResponse:
     """
@@ -52,95 +119,94 @@ async def analyze_image(image_base64: str, prompt: str = "What do you see?") ->
         # Assume JPEG if no prefix
         image_base64 = f"data:image/jpeg;base64,{image_base64}"
 
+    # Byte-identical frames (a static scene) skip the model call entirely
+    digest = hashlib.blake2b(prompt.encode(), digest_size=16)
+    digest.update(image_base64.encode())
+    cache_key = digest.digest()
+    cached = _vision_cache.get(cache_key)
+    if cached is not None:
+        _vision_cache.move_to_end(cache_key)
+        return cached
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                OPENROUTER_URL,
-                headers={
-                    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://huggingface.co/spaces/Franciscomoney/le_professeur_bizarre",
-                    "X-Title": "Le Professeur Bizarre Vision"
-                },
-                json={
-                    "model": VISION_MODEL,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": VISION_SYSTEM_PROMPT
-                        },
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": image_base64
-                                    }
-                                },
-                                {
-                                    "type": "text",
-                                    "text": prompt
+        # Base64 is 4/3 the raw size; small browser frames go through untouched
+        if Image is not None and len(image_base64) * 3 // 4 > DOWNSCALE_MIN_BYTES:
+            image_base64 = await asyncio.to_thread(_downscale, image_base64)
+
+        response = await _client.post(
+            OPENROUTER_URL,
+            headers=_HEADERS,
+            json={
+                "model": VISION_MODEL,
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": VISION_SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "image_url",
+                                "image_url": {
+                                    "url": image_base64
                                 }
-                            ]
-                        }
-                    ],
-                    "max_tokens": 500,  # Increased for reasoning tokens
-                    "temperature": 0.3  # Lower for more deterministic responses
-                },
-                timeout=30.0
-            )
+                            },
+                            {
+                                "type": "text",
+                                "text": prompt
+                            }
+                        ]
+                    }
+                ],
+                "max_tokens": 500,  # Increased for reasoning tokens
+                "temperature": 0.3  # Lower for more deterministic responses
+            }
+        )
+
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        message = data["choices"][0]["message"]
+        content = message.get("content", "").strip()
 
-            response.raise_for_status()
-            data = response.json()
-
-            message = data["choices"][0]["message"]
-            content = message.get("content", "").strip()
-
-            # Debug: print raw response
-            print(f"Vision API response - content: {repr(content)}")
-
-            # Check if content is empty but reasoning exists
-            if not content and message.get("reasoning"):
-                reasoning = message.get("reasoning", "")
-                print(f"Content empty, checking reasoning: {reasoning[:300]}...")
-                # Try to extract the object from reasoning
-                # Look for patterns like "it's a", "this is a", "I see a", etc.
-                import re
-                patterns = [
-                    r"it's\s+(?:a\s+)?([a-zA-Z\s]+?)(?:\.|,|$)",
-                    r"this\s+is\s+(?:a\s+)?([a-zA-Z\s]+?)(?:\.|,|$)",
-                    r"I\s+see\s+(?:a\s+)?([a-zA-Z\s]+?)(?:\.|,|$)",
-                    r"shows?\s+(?:a\s+)?([a-zA-Z\s]+?)(?:\.|,|$)",
-                ]
-                for pattern in patterns:
-                    match = re.search(pattern, reasoning, re.IGNORECASE)
-                    if match:
-                        content = match.group(1).strip()
-                        print(f"Extracted from reasoning: {content}")
-                        break
-
-            # Clean up the content
-            content = content.strip().lower()
-
-            # Check for unclear responses
-            if not content or content == "unclear" or "cannot" in content or "can't" in content:
-                return VisionResponse(
-                    description="unclear",
-                    french_word=None,
-                    pronunciation=None,
-                    cultural_note=None
-                )
-
-            # Return the identified object - let main model handle French
-            print(f"Vision identified: {content}")
+        # Debug: print raw response
+        print(f"Vision API response - content: {repr(content)}")
+
+        # Check if content is empty but reasoning exists
+        if not content and message.get("reasoning"):
+            reasoning = message.get("reasoning", "")
+            print(f"Content empty, checking reasoning: {reasoning[:300]}...")
+            # Try to extract the object from reasoning
+            for pattern in _OBJ_PATTERNS:
+                match = pattern.search(reasoning)
+                if match:
+                    content = match.group(1).strip()
+                    print(f"Extracted from reasoning: {content}")
+                    break
+
+        # Clean up the content
+        content = content.strip().lower()
+
+        # Check for unclear responses
+        if not content or content == "unclear" or "cannot" in content or "can't" in content:
+            # Not cached: a blurry or failed read of this frame should be retried
             return VisionResponse(
-                description=content,
-                french_word=None,  # Main model will provide French
+                description="unclear",
+                french_word=None,
                 pronunciation=None,
                 cultural_note=None
             )
 
+        # Return the identified object - let main model handle French
+        print(f"Vision identified: {content}")
+        return _cache_result(cache_key, VisionResponse(
+            description=content,
+            french_word=None,  # Main model will provide French
+            pronunciation=None,
+            cultural_note=None
+        ))
+
     except Exception as e:
         print(f"Vision error: {e}")
         return VisionResponse(
@@ -185,7 +251,6 @@ async def translate_text_in_image(image_base64: str) -> str:
 
 # Quick test
 if __name__ == "__main__":
-    import asyncio
 
     async def test():
         # Test with a simple prompt (no image)
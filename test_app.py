@@ -9,6 +9,15 @@ the Reachy Mini hardware or daemon.
 import os
 import sys
 import asyncio
+import argparse
+import hashlib
+import random
+import shelve
+import time
+from contextlib import nullcontext
+from functools import lru_cache
+
+import httpx
 
 # Add the package to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -16,95 +25,289 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from dotenv import load_dotenv
 load_dotenv()
 
-from le_professeur_bizarre.llm import NemotronTranslator, get_fallback_response
+from le_professeur_bizarre.llm import (
+    CONFUSED_FACT,
+    INCOMPLETE_FACT,
+    TRANSLATION_ERROR,
+    TRANSLATION_UNAVAILABLE,
+    NemotronTranslator,
+    get_fallback_response,
+)
+
+# Memoized locally only: the package version picks a random fallback per call,
+# which the app relies on, but a test run just needs one answer per phrase
+get_fallback_response = lru_cache(maxsize=512)(get_fallback_response)
+
+# Phrases translated by both the fallback and API paths
+TEST_PHRASES: tuple[str, ...] = (
+    "Hello, how are you?",
+    "I love cheese",
+    "Where is the bathroom?",
+    "This coffee is delicious",
+    "Can I have the check please?",
+)
+
+# Read once at import; load_dotenv() above has already filled in .env values
+API_KEY = os.getenv("OPENROUTER_API_KEY")
+MODEL = os.getenv("NEMOTRON_MODEL", "nvidia/nemotron-3-nano-30b-a3b")
+
+# Maximum translation requests in flight at once
+MAX_CONCURRENCY = int(os.getenv("LPB_MAX_CONCURRENCY", "5"))
+
+# Translations from earlier runs, keyed on model + phrase (set empty to disable)
+CACHE_PATH = os.getenv(
+    "LPB_TEST_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".lpb_test_cache")
+)
+
+
+async def prewarm(client: httpx.AsyncClient, url: str):
+    """Open a pooled connection (DNS, TCP, TLS) before the timed requests"""
+    # HEAD has no body to download, and any status (even 405) leaves the
+    # keep-alive connection in the pool
+    try:
+        await asyncio.wait_for(client.head(url), timeout=15)
+    except (httpx.HTTPError, asyncio.TimeoutError):
+        pass
+
+
+def is_transient(error: Exception) -> bool:
+    """Network hiccups, rate limits and 5xx are worth retrying; bad keys etc. are not"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+async def with_retry(call, *args, attempts=4, base_delay=0.2, max_delay=5.0):
+    """Await call(*args), retrying transient failures with exponential backoff and jitter"""
+    for attempt in range(attempts):
+        try:
+            return await call(*args)
+        except httpx.HTTPError as e:
+            if attempt == attempts - 1 or not is_transient(e):
+                raise
+            delay = min(max_delay, base_delay * 2 ** attempt)
+            await asyncio.sleep(delay + random.uniform(0, delay))
+
+
+# Placeholders translate() returns when it couldn't parse the model's reply
+DEGRADED_TRANSLATIONS = frozenset({"", TRANSLATION_ERROR, TRANSLATION_UNAVAILABLE})
+DEGRADED_FACTS = frozenset({INCOMPLETE_FACT, CONFUSED_FACT})
+
+
+def is_cacheable(response) -> bool:
+    """Only keep cleanly parsed replies, so a bad one is retried on the next run"""
+    return (response.french_translation not in DEGRADED_TRANSLATIONS
+            and response.cultural_fact not in DEGRADED_FACTS)
+
+
+def cache_key(translator, phrase):
+    return hashlib.sha256(f"{translator.model}\0{phrase}".encode()).hexdigest()
+
 
+async def cached_translate(translator, cache, phrase):
+    """Translate a phrase, reusing the stored response from a previous run"""
+    key = cache_key(translator, phrase)
+    if cache is not None and key in cache:
+        return cache[key]
+    response = await with_retry(translator.translate, phrase)
+    if cache is not None and is_cacheable(response):
+        cache[key] = response
+    return response
 
-async def test_translation():
+
+async def cached_translate_many(translator, cache, phrases, concurrency=MAX_CONCURRENCY):
+    """Translate every phrase missing from the cache in one batched request"""
+    keys = [cache_key(translator, phrase) for phrase in phrases]
+    misses = [phrase for phrase, key in zip(phrases, keys) if cache is None or key not in cache]
+    fresh = {}
+    if misses:
+        translated = await with_retry(translator.translate_many, misses, concurrency)
+        fresh = dict(zip(misses, translated))
+
+    results = []
+    for phrase, key in zip(phrases, keys):
+        if phrase in fresh:
+            if cache is not None and is_cacheable(fresh[phrase]):
+                cache[key] = fresh[phrase]
+            results.append(fresh[phrase])
+        else:
+            results.append(cache[key])
+    return results
+
+
+@lru_cache(maxsize=1)
+def get_translator(client: httpx.AsyncClient, short: bool = False) -> NemotronTranslator:
+    """One translator per shared client, reused by repeated test runs"""
+    if short:
+        # Faster, deterministic replies for models that answer without a <think> block;
+        # the default reasoning model needs the full budget to reach its JSON
+        return NemotronTranslator(API_KEY, client=client, max_tokens=200, temperature=0.0)
+    return NemotronTranslator(API_KEY, client=client)
+
+
+def print_result(phrase, response, label="Translating"):
+    """Print one translation result (or the error it raised) as a single write"""
+    lines = [f"📝 {label}: \"{phrase}\""]
+    if isinstance(response, Exception):
+        lines.append(f"❌ Error: {response}")
+    else:
+        lines.append(f"🇫🇷 French: {response.french_translation}")
+        lines.append(f"💡 Fact: {response.cultural_fact}")
+        if response.pronunciation_tip:
+            lines.append(f"🎤 Tip: {response.pronunciation_tip}")
+    lines.append("-" * 40)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def run_translation_test(
+    client: httpx.AsyncClient,
+    batch: bool = False,
+    phrases: tuple[str, ...] = TEST_PHRASES,
+    concurrency: int = MAX_CONCURRENCY,
+    short: bool = False,
+):
     """Test the translation with real API"""
     print("=" * 60)
     print("Le Professeur Bizarre - Translation Test")
     print("=" * 60)
 
-    api_key = os.getenv("OPENROUTER_API_KEY")
-
-    if not api_key:
+    if not API_KEY:
         print("\n⚠️  No OPENROUTER_API_KEY found in environment")
         print("   Testing with fallback responses...\n")
 
-        test_phrases = ["Hello", "I love cheese", "Where is the bathroom?"]
-        for phrase in test_phrases:
-            response = get_fallback_response(phrase)
-            print(f"📝 Input: {phrase}")
-            print(f"🇫🇷 French: {response.french_translation}")
-            print(f"💡 Fact: {response.cultural_fact}")
-            if response.pronunciation_tip:
-                print(f"🎤 Tip: {response.pronunciation_tip}")
-            print("-" * 40)
+        for phrase in phrases:
+            print_result(phrase, get_fallback_response(phrase), label="Input")
         return
 
     print(f"\n✓ API key found")
-    print(f"  Model: {os.getenv('NEMOTRON_MODEL', 'nvidia/nemotron-3-nano-30b-a3b')}")
+    print(f"  Model: {MODEL}")
     print()
 
-    translator = NemotronTranslator(api_key)
+    translator = get_translator(client, short)
+    await prewarm(client, translator.base_url)
 
-    test_phrases = [
-        "Hello, how are you?",
-        "I love cheese",
-        "Where is the bathroom?",
-        "This coffee is delicious",
-        "Can I have the check please?"
-    ]
+    # Run requests concurrently, capped so we stay under OpenRouter rate limits
+    semaphore = asyncio.Semaphore(concurrency)
+    started = time.perf_counter()
 
-    for phrase in test_phrases:
-        print(f"📝 Translating: \"{phrase}\"")
-        try:
-            response = await translator.translate(phrase)
-            print(f"🇫🇷 French: {response.french_translation}")
-            print(f"💡 Fact: {response.cultural_fact}")
-            if response.pronunciation_tip:
-                print(f"🎤 Tip: {response.pronunciation_tip}")
-        except Exception as e:
-            print(f"❌ Error: {e}")
-        print("-" * 40)
+    with shelve.open(CACHE_PATH) if CACHE_PATH else nullcontext() as cache:
+        async def translate_one(phrase):
+            async with semaphore:
+                try:
+                    return phrase, await cached_translate(translator, cache, phrase)
+                except Exception as e:
+                    return phrase, e
 
+        if batch:
+            # One request for all phrases instead of one round-trip each
+            try:
+                results = await cached_translate_many(translator, cache, phrases, concurrency)
+            except Exception as e:
+                results = [e] * len(phrases)
+            for phrase, response in zip(phrases, results):
+                print_result(phrase, response)
+        else:
+            # Print each result as soon as it lands rather than waiting on the slowest
+            for next_done in asyncio.as_completed([translate_one(p) for p in phrases]):
+                print_result(*await next_done)
+
+    elapsed = time.perf_counter() - started
+    mode = "batched" if batch else f"concurrency {concurrency}"
+    print(f"\n⏱️  {len(phrases)} phrases in {elapsed:.2f}s "
+          f"({len(phrases) / elapsed:.1f} phrases/s, {mode})")
     print("\n✅ Test complete!")
 
 
-async def test_server():
+async def run_server_probe(client: httpx.AsyncClient):
     """Test the FastAPI server"""
-    import httpx
-
     print("\n" + "=" * 60)
     print("Testing API Server")
     print("=" * 60)
 
-    base_url = "http://localhost:5173"
+    host, port = "localhost", 5173
+    base_url = f"http://{host}:{port}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # Test status endpoint
-            response = await client.get(f"{base_url}/api/apps/le_professeur_bizarre/status")
-            print(f"\n✓ Status endpoint: {response.json()}")
+    # Cheap TCP probe first so the common "not running" case bails out immediately
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=0.25)
+        writer.close()
+        await writer.wait_closed()
+    except (OSError, asyncio.TimeoutError):
+        print(f"\n⚠️  Server not running at {base_url}")
+        print("   Start it with: python -m le_professeur_bizarre.server")
+        return
+
+    await prewarm(client, base_url)
 
-            # Test translation endpoint
-            response = await client.post(
+    try:
+        # Status and translation endpoints are independent, so probe both at once
+        status, translation = await asyncio.gather(
+            client.get(f"{base_url}/api/apps/le_professeur_bizarre/status"),
+            client.post(
                 f"{base_url}/api/apps/le_professeur_bizarre/translate",
                 json={"text": "Hello world"}
-            )
-            print(f"✓ Translation endpoint: {response.json()}")
+            ),
+        )
+        status.raise_for_status()
+        translation.raise_for_status()
+        print(f"\n✓ Status endpoint: {status.json()}")
+        print(f"✓ Translation endpoint: {translation.json()}")
+
+    except httpx.ConnectError:
+        print(f"\n⚠️  Server not running at {base_url}")
+        print("   Start it with: python -m le_professeur_bizarre.server")
+    except (httpx.HTTPError, ValueError) as e:
+        # Report rather than raise, so a bad server reply can't abort the translation test
+        print(f"\n❌ Server probe failed: {e}")
+
+
+def parse_args(argv=None):
+    """Command-line options for scaling runs (fan-out, repeats, batching)"""
+    parser = argparse.ArgumentParser(description="Le Professeur Bizarre test suite")
+    parser.add_argument("--server", action="store_true",
+                        help="also probe the local API server")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY,
+                        help="translation requests in flight at once; with --batch it only "
+                             "limits the per-phrase fallback (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="translate the phrase set this many times "
+                             "(set LPB_TEST_CACHE= to measure the API rather than the cache)")
+    parser.add_argument("--batch", action="store_true",
+                        help="send all phrases in one request instead of one per phrase")
+    parser.add_argument("--short", action="store_true",
+                        help="cap replies at 200 tokens with temperature 0; too small for "
+                             "reasoning models such as the default Nemotron")
+    return parser.parse_args(argv)
+
 
-        except httpx.ConnectError:
-            print(f"\n⚠️  Server not running at {base_url}")
-            print("   Start it with: python -m le_professeur_bizarre.server")
+async def main(args):
+    """Run the tests concurrently on one event loop, sharing a keep-alive HTTP client"""
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        # Translation test always runs; the server test is optional.
+        # They are independent, so overlap the API calls with the local probes.
+        tests = [run_translation_test(
+            client,
+            batch=args.batch,
+            phrases=TEST_PHRASES * args.repeat,
+            concurrency=args.concurrency,
+            short=args.short,
+        )]
+        if args.server:
+            tests.append(run_server_probe(client))
+        await asyncio.gather(*tests)
 
 
 if __name__ == "__main__":
+    args = parse_args()
     print("\n🇫🇷 Le Professeur Bizarre Test Suite 🇺🇸\n")
 
-    # Run translation test
-    asyncio.run(test_translation())
+    # uvloop ships with the speedups extra (not on Windows); stdlib loop otherwise
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
-    # Optionally test server
-    if "--server" in sys.argv:
-        asyncio.run(test_server())
+    asyncio.run(main(args))